@@ -6,6 +6,10 @@ Consume json messages from a Kafka topic and visualize author counts in real-tim
 Example Kafka message format:
 {"timestamp": "2025-01-11T18:15:00Z", "temperature": 225.0}
 
+Message values are kept as raw bytes and parsed directly (no str decode).
+Deployment note: enable compression on the producer (compression_type="lz4")
+to cut network and deserialization time; the consumer decompresses transparently.
+
 """
 
 #####################################
@@ -13,23 +17,41 @@ Example Kafka message format:
 #####################################
 
 # Import packages from Python Standard Library
+import math
 import os
-import json  # handle JSON parsing
+import pathlib
+import re
+import threading
 import time
-
-# Use a deque ("deck") - a double-ended queue data structure
-# A deque is a good way to monitor a certain number of "most recent" messages
-# A deque is a great data structure for time windows (e.g. the last 5 messages)
-from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable
 
 # Import external packages
 from dotenv import load_dotenv
+import numpy as np
+import orjson  # fast JSON parsing (accepts str or bytes)
+
+# Import Numba only if available - fall back to plain Python if not
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        def decorator(func):
+            return func
+        return decorator
 
 # IMPORTANT
 # Import Matplotlib.pyplot for live plotting
 # Use the common alias 'plt' for Matplotlib.pyplot
 # Know pyplot well
+import matplotlib
 import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+import matplotlib.image as mpimg
 
 # Import functions from local modules
 from utils.utils_consumer import create_kafka_consumer
@@ -71,136 +93,695 @@ def get_high_temp_threshold() -> float:
     logger.info(f"High temp threshold: {threshold}°F")
     return threshold
 
+
+def get_mpl_backend() -> str:
+    """Fetch Matplotlib backend from environment or use default (empty = Matplotlib's choice)."""
+    backend = os.getenv("MPL_BACKEND", "").strip()
+    logger.info(f"Matplotlib backend: {backend or 'default'}")
+    return backend
+
+
+def get_chart_image_path() -> pathlib.Path:
+    """Fetch headless chart image path from environment or use default."""
+    image_path = pathlib.Path(os.getenv("SMOKER_CHART_IMAGE_PATH", "data/smoker_live_chart.png"))
+    logger.info(f"Headless chart image path: {image_path}")
+    return image_path
+
+
+def get_fetch_min_bytes() -> int:
+    """Fetch minimum bytes per Kafka fetch from environment or use default."""
+    fetch_min_bytes = int(os.getenv("SMOKER_FETCH_MIN_BYTES", 65536))
+    logger.info(f"Fetch min bytes: {fetch_min_bytes}")
+    return fetch_min_bytes
+
+
+def get_fetch_max_bytes() -> int:
+    """Fetch maximum bytes per Kafka fetch from environment or use default."""
+    fetch_max_bytes = int(os.getenv("SMOKER_FETCH_MAX_BYTES", 50 * 1024 * 1024))
+    logger.info(f"Fetch max bytes: {fetch_max_bytes}")
+    return fetch_max_bytes
+
+
+def get_max_partition_fetch_bytes() -> int:
+    """Fetch maximum bytes per partition per Kafka fetch from environment or use default."""
+    max_partition_fetch_bytes = int(os.getenv("SMOKER_MAX_PARTITION_FETCH_BYTES", 5 * 1024 * 1024))
+    logger.info(f"Max partition fetch bytes: {max_partition_fetch_bytes}")
+    return max_partition_fetch_bytes
+
+
+def get_max_poll_records() -> int:
+    """Fetch maximum records per poll from environment or use default."""
+    max_poll_records = int(os.getenv("SMOKER_MAX_POLL_RECORDS", 500))
+    logger.info(f"Max poll records: {max_poll_records}")
+    return max_poll_records
+
+
+def get_fetch_max_wait_ms() -> int:
+    """Fetch maximum broker wait per Kafka fetch from environment or use default."""
+    fetch_max_wait_ms = int(os.getenv("SMOKER_FETCH_MAX_WAIT_MS", 500))
+    logger.info(f"Fetch max wait (ms): {fetch_max_wait_ms}")
+    return fetch_max_wait_ms
+
+
+def get_enable_auto_commit() -> bool:
+    """Fetch whether offsets are auto-committed from environment or use default."""
+    enable_auto_commit = os.getenv("SMOKER_ENABLE_AUTO_COMMIT", "true").strip().lower() == "true"
+    logger.info(f"Enable auto commit: {enable_auto_commit}")
+    return enable_auto_commit
+
+
+def get_auto_commit_interval_ms() -> int:
+    """Fetch auto commit interval from environment or use default."""
+    auto_commit_interval_ms = int(os.getenv("SMOKER_AUTO_COMMIT_INTERVAL_MS", 5000))
+    logger.info(f"Auto commit interval (ms): {auto_commit_interval_ms}")
+    return auto_commit_interval_ms
+
 #####################################
-# Set up data structures (empty lists)
+# Cached Settings
 #####################################
 
-timestamps = []  # To store timestamps for the x-axis
-temperatures = []  # To store temperature readings for the y-axis
+# Read once at startup so the hot path never re-parses the environment
+HIGH_TEMP_THRESHOLD = get_high_temp_threshold()
 
 #####################################
 # Analytics
 #####################################
 
-total_messages = 0
-high_temps_sum = 0.0
-high_temp_count = 0
-window_messages = 0
-window_start = time.time()
+
+@dataclass
+class Stats:
+    """
+    Running analytics for the stream, created once in main() and passed explicitly.
+
+    counters and high_sum are small NumPy arrays so the compiled kernel
+    in append_readings() can update them in place.
+    """
+
+    counters: np.ndarray = field(
+        default_factory=lambda: np.zeros(2, dtype=np.int64)
+    )  # [total_messages, high_temp_count]
+    high_sum: np.ndarray = field(default_factory=lambda: np.zeros(1, dtype=np.float64))
+    window_msgs: int = 0  # valid readings since the last analytics report
+    window_start: float = field(default_factory=time.time)
+
+    @property
+    def total(self) -> int:
+        """Total messages processed so far."""
+        return int(self.counters[0])
+
+    @property
+    def avg_high_temp(self) -> float:
+        """Average of readings at or above the high temp threshold."""
+        high_count = self.counters[1]
+        return float(self.high_sum[0] / high_count) if high_count else 0.0
+
+
+#####################################
+# Set up data structures (fixed-size ring buffers)
+#####################################
+
+# Structure-of-arrays ring buffers of window_size slots:
+# - timestamps store reading times (datetime64[s]) for the x-axis
+# - temperatures store temperature readings (float32) for the y-axis
+# Each reading is written twice (at i and i + window_size) so the most
+# recent readings are always available as one contiguous slice without
+# copying or np.roll.
+timestamps = np.empty(0, dtype="datetime64[s]")
+temperatures = np.empty(0, dtype=np.float32)
+reading_count = 0  # total readings written (not wrapped)
+
+# The consumer thread writes the buffers while the GUI thread reads them
+buffer_lock = threading.Lock()
+
+
+def reset_buffers(window_size: int) -> None:
+    """
+    Allocate empty ring buffers holding the most recent window_size readings.
+
+    Args:
+        window_size (int): Number of readings to keep (and bars to draw).
+    """
+    global timestamps, temperatures, reading_count
+
+    timestamps = np.empty(2 * window_size, dtype="datetime64[s]")
+    temperatures = np.empty(2 * window_size, dtype=np.float32)
+    reading_count = 0
+
+
+@njit(cache=True)
+def _update_stats(times, temps, threshold, counters, high_sum, time_ring, temp_ring, write_count):
+    """
+    Compiled numeric kernel: count readings, accumulate high temps, fill the rings.
+
+    Args:
+        times (np.ndarray): int64 reading times (datetime64[s] viewed as int64) from one batch.
+        temps (np.ndarray): float32 readings from one batch.
+        threshold (np.float32): High temp threshold, at the readings' precision.
+        counters (np.ndarray): int64 [total_messages, high_temp_count], updated in place.
+        high_sum (np.ndarray): float64 [high_temps_sum], updated in place.
+        time_ring (np.ndarray): int64 view of the mirrored timestamp ring, updated in place.
+        temp_ring (np.ndarray): float32 mirrored temperature ring, updated in place.
+        write_count (int): Total readings written to the rings before this batch.
+    """
+    capacity = temp_ring.shape[0] // 2
+
+    # Only the newest capacity readings can survive the write
+    first_kept = max(0, temps.shape[0] - capacity)
+
+    for i in range(temps.shape[0]):
+        temp = temps[i]
+        counters[0] += 1
+        if temp >= threshold:
+            counters[1] += 1
+            high_sum[0] += temp
+        if i >= first_kept:
+            slot = (write_count + i) % capacity
+            time_ring[slot] = times[i]
+            time_ring[slot + capacity] = times[i]
+            temp_ring[slot] = temp
+            temp_ring[slot + capacity] = temp
+
+
+def warm_up_kernel() -> None:
+    """
+    Compile the stats kernel with an empty batch before consuming starts.
+
+    With Numba, the first call compiles (or loads from cache), which can
+    take seconds. Doing it up front keeps that out of buffer_lock, where it
+    would freeze the chart. The argument types match append_readings().
+    """
+    started = time.monotonic()
+    _update_stats(
+        np.empty(0, dtype=np.int64),
+        np.empty(0, dtype=np.float32),
+        np.float32(HIGH_TEMP_THRESHOLD),
+        np.zeros(2, dtype=np.int64),
+        np.zeros(1, dtype=np.float64),
+        np.empty(0, dtype=np.int64),
+        np.empty(0, dtype=np.float32),
+        0,
+    )
+    if NUMBA_AVAILABLE:
+        logger.info(f"Stats kernel ready in {time.monotonic() - started:.2f}s")
+
+
+def append_readings(times: list, values: list, stats: Stats) -> None:
+    """
+    Append readings and update the high temp analytics.
+
+    Overwrites the oldest readings once the buffers are full.
+
+    Args:
+        times (list): datetime64 reading times to append.
+        values (list): Temperature readings to append.
+        stats (Stats): Running analytics, updated in place.
+    """
+    global reading_count
+
+    batch_times = np.asarray(times, dtype="datetime64[s]").view(np.int64)
+    batch_temps = np.asarray(values, dtype=np.float32)
+    # Readings are stored as float32, so compare them against a float32 threshold
+    # (a float64 threshold like 225.7 would not match a stored 225.7 reading)
+    _update_stats(
+        batch_times,
+        batch_temps,
+        np.float32(HIGH_TEMP_THRESHOLD),
+        stats.counters,
+        stats.high_sum,
+        timestamps.view(np.int64),
+        temperatures,
+        reading_count,
+    )
+    reading_count += len(batch_temps)
+
+
+def recent_readings() -> tuple:
+    """Return contiguous views of the buffered (times, temperatures), oldest first."""
+    capacity = len(temperatures) // 2
+    count = min(reading_count, capacity)
+    start = (reading_count - count) % capacity
+    return timestamps[start : start + count], temperatures[start : start + count]
+
 
 #####################################
 # Set up live visuals
 #####################################
 
+# Optionally pick the backend before any figure exists, e.g. MPL_BACKEND=QtAgg
+# to avoid a slower fallback such as Tk. When unset, Matplotlib picks the
+# first one available (QtAgg where PyQt6 is installed).
+# Use MPL_BACKEND=Agg to run headless and write each frame to an image file.
+mpl_backend = get_mpl_backend()
+if mpl_backend:
+    try:
+        matplotlib.use(mpl_backend)
+    except (ImportError, ValueError) as e:
+        logger.warning(f"Could not use backend ({e}); using {matplotlib.get_backend()}")
+
+HEADLESS = matplotlib.get_backend().lower() == "agg"
+HEADLESS_DPI = 80
+CHART_IMAGE_PATH = get_chart_image_path() if HEADLESS else None
+
 # Use the subplots() method to create a tuple containing
 # two objects at once:
 # - a figure (which can have many axis)
 # - an axis (what they call a chart in Matplotlib)
-fig, ax = plt.subplots()
+fig, ax = plt.subplots(dpi=HEADLESS_DPI if HEADLESS else None)
 
-# Use the ion() method (stands for "interactive on")
-# to turn on interactive mode for live updates
-plt.ion()
+# Set the labels and title once - they never change between frames
+ax.set_xlabel("Time")
+ax.set_ylabel("Temperature (°F)")
+ax.set_title("Smart Smoker: Temperature vs. Time by James Pinkston")
+
+# Configure the time axis once: smart date ticks, concise labels, rotated 45°
+# tick_params() also applies to tick labels created later, unlike
+# rotating the current labels (or calling plt.xticks) each frame
+date_locator = mdates.AutoDateLocator()
+ax.xaxis.set_major_locator(date_locator)
+ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(date_locator))
+ax.tick_params(axis="x", labelrotation=45)
+
+# Use the tight_layout() method exactly once to automatically adjust the padding
+# The layout solver re-measures every tick label, so it must never run per frame
+# (constrained_layout is avoided for the same reason: it re-solves on every draw)
+fig.tight_layout()
+
+# Mark the x-axis as animated so its (sliding) ticks are blitted along
+# with the bars instead of being baked into the cached background
+ax.xaxis.set_animated(True)
+
+# Persistent bar artists and the cached static background for blitting
+bars = None
+background = None
+
+# Reading count when the headless image was last written (-1 = never)
+saved_reading_count = -1
+
+# Redraw every 50 ms (~20 FPS) on a GUI timer, regardless of message rate
+CHART_REDRAW_INTERVAL_S = 0.05
+
+# Bar width used until there are two readings to measure spacing from
+ONE_SECOND_IN_DAYS = 1 / 86400
+
+
+def cache_background(event=None) -> None:
+    """Re-cache the static background after any full draw (e.g. a resize)."""
+    global background
+    background = fig.canvas.copy_from_bbox(fig.bbox)
+
+
+fig.canvas.mpl_connect("draw_event", cache_background)
 
 #####################################
 # Define an update chart function for live plotting
-# This will get called every time a new message is processed
+# This will get called by a GUI timer on the main thread
 #####################################
 
-def update_chart():
+
+def bar_geometry(times: np.ndarray) -> tuple:
     """
-    Update temperature vs. time chart.
+    Convert reading times to x positions on the date axis.
+
     Args:
-        rolling_window (deque): Rolling window of temperature readings.
-        window_size (int): Size of the rolling window.
+        times (np.ndarray): datetime64 reading times, oldest first.
+
+    Returns:
+        tuple: (x positions as Matplotlib date numbers, bar width in days)
+    """
+    positions = mdates.date2num(times)
+    spacing = float(np.median(np.diff(positions))) if len(positions) > 1 else 0.0
+    width = 0.8 * (spacing if spacing > 0 else ONE_SECOND_IN_DAYS)
+    return positions, width
+
+
+def rebuild_chart(positions: np.ndarray, width: float, temps: np.ndarray, bar_colors: np.ndarray) -> None:
+    """
+    Recreate the bars and re-cache the static background.
+
+    Only needed when the number of bars changes or the data no longer
+    fits the current y-axis limits.
+
+    Args:
+        positions (np.ndarray): Bar centers as Matplotlib date numbers.
+        width (float): Bar width in days.
+        temps (np.ndarray): Temperature readings to draw.
+        bar_colors (np.ndarray): Color for each bar.
     """
-    # Clear the previous chart
-    ax.clear()
+    global bars
 
-    # Fetch the high temp threshold
-    high_temp_threshold = get_high_temp_threshold()
+    # Remove only the old bars - axes, labels, and title are kept
+    if bars is not None:
+        bars.remove()
 
     # Create a bar chart
-    # Use the timestamps for the x-axis and temperatures for the y-axis
-    # Use the label parameter to add a legend entry
+    # Use the reading times for the x-axis and temperatures for the y-axis
     # Use the color parameter to set the bar color
-    # Create a seperate bar color for detected high temps
-    bar_colors = ["red" if temp >= high_temp_threshold else "blue" for temp in temperatures]
-    ax.bar(timestamps, temperatures, color=bar_colors)
-    
-    # Use the built-in axes methods to set the labels and title
-    ax.set_xlabel("Time")
-    ax.set_ylabel("Temperature (°F)")
-    ax.set_title("Smart Smoker: Temperature vs. Time by James Pinkston")
-    plt.xticks(rotation=45)
+    bars = ax.bar(positions, temps, width=width, color=bar_colors, animated=True)
+    ax.set_ylim(0, float(temps.max()) * 1.1)
+
+    # Draw the static parts of the figure (cached by the draw_event callback)
+    fig.canvas.draw()
+
+
+def update_chart():
+    """
+    Update temperature vs. time chart.
 
-    # Use the tight_layout() method to automatically adjust the padding
-    plt.tight_layout()
+    Bar heights and colors are updated in place and blitted over the
+    cached background instead of clearing and redrawing the whole axes.
+    """
+    global saved_reading_count
 
-    # Draw the chart
-    plt.draw()
+    # Take a consistent snapshot of the buffers written by the consumer thread
+    with buffer_lock:
+        if reading_count == 0:
+            # Nothing to draw yet
+            return
+        count = reading_count
+        times, temps = (view.copy() for view in recent_readings())
+
+    positions, width = bar_geometry(times)
+
+    # Create a seperate bar color for detected high temps (one vector compare)
+    # Compare in float32, like the stats kernel, so red bars match the high temp count
+    bar_colors = np.where(temps >= np.float32(HIGH_TEMP_THRESHOLD), "red", "blue")
+
+    if (
+        bars is None
+        or len(bars) != len(temps)
+        or temps.max() > ax.get_ylim()[1]
+    ):
+        rebuild_chart(positions, width, temps, bar_colors)
+    else:
+        for rect, x, temp, color in zip(bars, positions, temps, bar_colors):
+            rect.set_x(x - width / 2)
+            rect.set_width(width)
+            rect.set_height(temp)
+            rect.set_color(color)
+
+    # Slide the time window - the animated x-axis re-ticks itself when drawn
+    ax.set_xlim(positions[0] - width, positions[-1] + width)
+
+    # Blit the animated artists over the cached background
+    fig.canvas.restore_region(background)
+    for rect in bars:
+        ax.draw_artist(rect)
+    ax.draw_artist(ax.xaxis)
+    fig.canvas.blit(fig.bbox)
+    fig.canvas.flush_events()
+
+    if HEADLESS and count != saved_reading_count:
+        save_frame()
+        saved_reading_count = count
+
+
+def save_frame() -> None:
+    """
+    Write the current blitted frame to CHART_IMAGE_PATH (headless mode).
 
-    # Pause briefly to allow some time for the chart to render
-    plt.pause(0.01)  
+    savefig() would redraw without the animated artists, so the canvas
+    buffer is saved instead. The image goes to a temporary file that then
+    replaces the target, so readers never see a half-written file.
+    """
+    temp_path = CHART_IMAGE_PATH.with_name(f".{CHART_IMAGE_PATH.stem}.tmp{CHART_IMAGE_PATH.suffix}")
+    mpimg.imsave(temp_path, np.asarray(fig.canvas.buffer_rgba()))
+    os.replace(temp_path, CHART_IMAGE_PATH)
 
 
 #####################################
-# Function to process a single message
+# Function to parse a single message
+#####################################
+
+# Every message on this topic has the same two-field shape, so a parser
+# specialized for exactly these fields is generated once at import
+SMOKER_MESSAGE_FIELDS = (("timestamp", "str"), ("temperature", "float"))
+
+
+# A JSON number (RFC 8259), with optional surrounding JSON whitespace
+JSON_NUMBER = re.compile(rb"[ \t\r\n]*-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?[ \t\r\n]*")
+
+
+class InvalidMessageError(ValueError):
+    """Raised when a message is valid JSON but is missing a required field."""
+
+
+def build_reading_parser(fields: tuple) -> Callable[[bytes], tuple]:
+    """
+    Generate a parser specialized for a fixed, flat JSON message schema.
+
+    Each field's key and key length are baked into the generated source as
+    literals, and each value is located with a direct byte scan, so the
+    parser does no dict building, .get() lookups, or None checks. The fast
+    path only checks that the message is framed as an object and that each
+    value is a plain string or strict JSON number; anything else (other key
+    spacing, escapes, null or non-numeric values, str input, truncated or
+    malformed messages) falls back to a full orjson parse, which validates
+    the whole message and checks each value's type.
+
+    Args:
+        fields (tuple): (name, kind) pairs in return order; kind is "str" or "float".
+
+    Returns:
+        callable: parse(message) -> tuple of field values in schema order.
+            The callable raises InvalidMessageError for missing, null, or
+            wrongly typed fields, and orjson.JSONDecodeError for non-JSON input.
+
+    Raises:
+        ValueError: If a field kind is not supported.
+    """
+    for name, kind in fields:
+        if kind not in ("str", "float"):
+            raise ValueError(f"Unsupported field kind for '{name}': {kind}")
+
+    def fallback(message):
+        data = orjson.loads(message)
+        if not isinstance(data, dict):
+            raise InvalidMessageError("message is not a JSON object")
+        values = []
+        for name, kind in fields:
+            value = data.get(name)
+            if value is None:
+                raise InvalidMessageError(f"missing or null field '{name}'")
+            if kind == "str" and not isinstance(value, str):
+                raise InvalidMessageError(f"field '{name}' is not a string")
+            if kind == "float" and (isinstance(value, bool) or not isinstance(value, (int, float))):
+                raise InvalidMessageError(f"field '{name}' is not a number")
+            values.append(value)
+        return tuple(values)
+
+    # Framing check: the whole message must look like one object, so a
+    # truncated message or trailing garbage goes to the fallback
+    lines = [
+        "def parse(m):",
+        "    try:",
+        "        t = m.strip()",
+        "        if t[:1] != b'{' or t[-1:] != b'}':",
+        "            raise ValueError",
+    ]
+    for n, (name, kind) in enumerate(fields):
+        key = f'"{name}":'.encode()
+        lines += [
+            f"        s = m.find({key!r})",
+            "        if s < 0:",
+            "            raise ValueError",
+            f"        s += {len(key)}",
+        ]
+        if kind == "float":
+            # A number runs up to the next "," (or "}" for the last field)
+            # float() also accepts non-JSON forms like "1_000", "+5", ".5", or
+            # "01", so anything but a strict JSON number is left to the fallback
+            lines += [
+                "        e = m.find(b',', s)",
+                "        if e < 0:",
+                "            e = m.find(b'}', s)",
+                "        if e < 0:",
+                "            raise ValueError",
+                f"        v{n} = m[s:e]",
+                f"        if not is_number(v{n}):",
+                "            raise ValueError",
+                f"        v{n} = float(v{n})",
+                f"        if not isfinite(v{n}):",
+                "            raise ValueError",
+            ]
+        elif kind == "str":
+            # A string is everything between the next pair of quotes
+            lines += [
+                "        q = m.index(b'\"', s)",
+                "        if m[s:q].strip():",
+                "            raise ValueError",
+                "        e = m.index(b'\"', q + 1)",
+                f"        v{n} = m[q + 1:e]",
+                f"        if b'\\\\' in v{n}:",
+                "            raise ValueError",
+                f"        v{n} = v{n}.decode('ascii')",
+            ]
+    values = ", ".join(f"v{n}" for n in range(len(fields)))
+    lines += [
+        f"        return {values}",
+        "    except (ValueError, TypeError):",
+        "        return fallback(m)",
+    ]
+    src = "\n".join(lines)
+    logger.debug("Generated message parser:\n{}", src)
+
+    namespace = {
+        "fallback": fallback,
+        "isfinite": math.isfinite,
+        "is_number": JSON_NUMBER.fullmatch,
+    }
+    exec(compile(src, "<smoker_message_parser>", "exec"), namespace)
+    return namespace["parse"]
+
+
+# parse_reading(message: bytes) -> (timestamp, temperature)
+parse_reading = build_reading_parser(SMOKER_MESSAGE_FIELDS)
+
+
+#####################################
+# Function to process a batch of messages
 # #####################################
 
 
-def process_message(message: str, rolling_window: deque, window_size: int):
-    global total_messages, high_temps_sum, high_temp_count, window_messages, window_start
+def process_batch(messages: list, window_size: int, stats: Stats):
     """
-    Process a JSON-transferred CSV message and check for stalls.
+    Process a batch of JSON messages polled from Kafka.
+
+    Runs on the consumer thread: it only parses and appends to the shared
+    buffers. Drawing happens separately on the GUI thread.
 
     Args:
-        message (str): JSON message received from Kafka.
-        rolling_window (deque): Rolling window of temperature readings.
-        window_size (int): Size of the rolling window.
+        messages (list): Raw JSON message bytes received from Kafka.
+        window_size (int): Size of the rolling window (also the report interval in seconds).
+        stats (Stats): Running analytics, updated in place.
     """
-    try:
-        # Log the raw message for debugging
-        logger.debug(f"Raw message: {message}")
+    batch_timestamps = []
+    batch_temperatures = []
+
+    for message in messages:
+        try:
+            # Log the raw message for debugging
+            # Use loguru's lazy {} formatting so the string is only built
+            # if DEBUG is enabled (not on every message)
+            logger.debug("Raw message: {}", message)
+
+            # Extract the two fields directly from the raw bytes
+            timestamp, temperature = parse_reading(message)
+            logger.debug("Parsed reading: {} {}", timestamp, temperature)
 
-        # Parse the JSON string into a Python dictionary
-        data = json.loads(message)
-        temperature = data.get("temperature")
-        timestamp = data.get("timestamp")
-        logger.info(f"Processed JSON message: {data}")
+            # Convert both values before appending so a bad record only drops itself
+            # Parse the ISO timestamp once at ingest (UTC; numpy rejects a "Z" suffix)
+            reading_time = np.datetime64(timestamp.rstrip("Z"), "s")
+            reading_temperature = float(temperature)
 
-        if timestamp is None or temperature is None:
+            batch_timestamps.append(reading_time)
+            batch_temperatures.append(reading_temperature)
+
+        except InvalidMessageError:
             logger.error(f"Invalid message: {message}")
-            return
-        
-        timestamps.append(timestamp)
-        temperatures.append(temperature)
-
-        total_messages += 1
-        window_messages += 1
-        if temperature >= get_high_temp_threshold():
-            high_temps_sum += temperature
-            high_temp_count += 1
-
-        # Update chart
-        update_chart()
-
-        # Periodic analytics report
-        elapsed = time.time() - window_start
-        if elapsed >= get_rolling_window_size():
-            avg_high_temp = high_temps_sum / high_temp_count if high_temp_count else 0.0
-            print("\n=== Analytics ===")
-            print(f"Total messages so far: {total_messages}")
-            print(f"Average high temp so far: {avg_high_temp:.2f}°F")
-            print("===================\n")
-
-            window_messages = 0
-            window_start = time.time()
-
-    except json.JSONDecodeError as e:
-        logger.error(f"JSON decoding error for message '{message}': {e}")
+        except orjson.JSONDecodeError as e:
+            logger.error(f"JSON decoding error for message '{message}': {e}")
+        except Exception as e:
+            logger.error(f"Error processing message '{message}': {e}")
+
+    if not batch_timestamps:
+        return
+
+    # Extend the chart series once for the whole batch
+    with buffer_lock:
+        append_readings(batch_timestamps, batch_temperatures, stats)
+
+    stats.window_msgs += len(batch_timestamps)
+
+    # Periodic analytics report (every window_size seconds, read once in main())
+    elapsed = time.time() - stats.window_start
+    if elapsed >= window_size:
+        print("\n=== Analytics ===")
+        print(f"Total messages so far: {stats.total}")
+        print(f"Messages in the last {elapsed:.0f}s: {stats.window_msgs}")
+        print(f"Average high temp so far: {stats.avg_high_temp:.2f}°F")
+        print("===================\n")
+
+        stats.window_msgs = 0
+        stats.window_start = time.time()
+
+
+#####################################
+# Define a consumer loop (runs on a background thread)
+#####################################
+
+
+def log_commit_failure(offsets, response) -> None:
+    """
+    Log a failed asynchronous offset commit (kafka-python commit_async callback).
+
+    Args:
+        offsets (dict): {TopicPartition: OffsetAndMetadata} that were committed.
+        response: The commit result, or an Exception if the commit failed.
+    """
+    if isinstance(response, Exception):
+        logger.error(f"Offset commit failed for {offsets}: {response}")
+
+
+def consume_messages(
+    consumer,
+    topic: str,
+    stop_event: threading.Event,
+    window_size: int,
+    max_poll_records: int,
+    fetch_max_wait_ms: int,
+    enable_auto_commit: bool,
+    stats: Stats,
+) -> None:
+    """
+    Poll batches from Kafka and append them to the shared buffers.
+
+    Args:
+        consumer (KafkaConsumer): Consumer to poll.
+        topic (str): Topic being consumed (for logging).
+        stop_event (threading.Event): Set by the main thread to stop polling.
+        window_size (int): Size of the rolling window.
+        max_poll_records (int): Maximum records returned by a single poll().
+        fetch_max_wait_ms (int): Poll timeout in milliseconds.
+        enable_auto_commit (bool): If False, commit once per processed batch.
+        stats (Stats): Running analytics, updated in place.
+    """
+    logger.info(f"Polling messages from topic '{topic}'...")
+    stopped_cleanly = False
+    try:
+        while not stop_event.is_set():
+            # poll() returns {TopicPartition: [records]} with up to max_records total
+            records = consumer.poll(timeout_ms=fetch_max_wait_ms, max_records=max_poll_records)
+            if not records:
+                continue
+
+            messages = []
+            for partition_records in records.values():
+                for message in partition_records:
+                    logger.debug(
+                        "Received message at offset {}: {}", message.offset, message.value
+                    )
+                    messages.append(message.value)
+
+            process_batch(messages, window_size, stats)
+
+            # In manual mode, commit once per fully processed batch - never per message
+            if not enable_auto_commit:
+                consumer.commit_async(callback=log_commit_failure)
+        stopped_cleanly = True
     except Exception as e:
-        logger.error(f"Error processing message '{message}': {e}")
+        logger.exception(f"Error while consuming messages: {e}")
+    finally:
+        # close() only commits on its own when auto-commit is enabled.
+        # After an error, poll() has already moved past a batch that may not
+        # have been processed - skip the commit so it is re-delivered.
+        if not enable_auto_commit and stopped_cleanly:
+            try:
+                consumer.commit()
+            except Exception as e:
+                logger.error(f"Final offset commit failed: {e}")
+        consumer.close()
+        logger.info(f"Kafka consumer for topic '{topic}' closed.")
+
 
 #####################################
 # Define main function for this module
@@ -213,38 +794,103 @@ def main() -> None:
 
     - Reads the Kafka topic name and consumer group ID from environment variables.
     - Creates a Kafka consumer using the `create_kafka_consumer` utility.
-    - Polls messages and updates a live chart.
+    - Polls messages on a background thread.
+    - Redraws the live chart on a fixed-rate GUI timer on the main thread.
     """
     logger.info("START consumer.")
 
-    # Clear previous run's data
-    timestamps.clear()
-    temperatures.clear()
-
     # fetch .env content
     topic = get_kafka_topic()
     group_id = get_kafka_consumer_group_id()
     window_size = get_rolling_window_size()
+
+    # Clear previous run's data and bound the chart to window_size readings
+    reset_buffers(window_size)
     
-    rolling_window = deque(maxlen=window_size)
+    max_poll_records = get_max_poll_records()
+    fetch_max_wait_ms = get_fetch_max_wait_ms()
+    enable_auto_commit = get_enable_auto_commit()
+
+    stats = Stats()
+
+    # Compile the stats kernel now, not under buffer_lock on the first batch
+    warm_up_kernel()
 
     # Create the Kafka consumer using the helpful utility function.
-    consumer = create_kafka_consumer(topic, group_id)
+    # Larger fetches amortize per-message overhead and broker round-trips.
+    # Keep values as raw bytes - orjson parses bytes directly, so decoding
+    # to str first would only add a copy per message
+    consumer = create_kafka_consumer(
+        topic,
+        group_id,
+        value_deserializer_provided=lambda value: value,
+        fetch_min_bytes=get_fetch_min_bytes(),
+        fetch_max_bytes=get_fetch_max_bytes(),
+        max_partition_fetch_bytes=get_max_partition_fetch_bytes(),
+        max_poll_records=max_poll_records,
+        fetch_max_wait_ms=fetch_max_wait_ms,
+        enable_auto_commit=enable_auto_commit,
+        auto_commit_interval_ms=get_auto_commit_interval_ms(),
+    )
+
+    # Consume on a daemon thread so rendering never blocks ingestion
+    stop_event = threading.Event()
+    consumer_thread = threading.Thread(
+        target=consume_messages,
+        args=(
+            consumer,
+            topic,
+            stop_event,
+            window_size,
+            max_poll_records,
+            fetch_max_wait_ms,
+            enable_auto_commit,
+            stats,
+        ),
+        daemon=True,
+    )
+    consumer_thread.start()
+
+    if HEADLESS:
+        # No GUI event loop (or timers) on Agg - redraw on a plain loop instead
+        CHART_IMAGE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            while consumer_thread.is_alive():
+                update_chart()
+                time.sleep(CHART_REDRAW_INTERVAL_S)
+        except KeyboardInterrupt:
+            logger.warning("Consumer interrupted by user.")
+        finally:
+            stop_event.set()
+            consumer_thread.join(timeout=(fetch_max_wait_ms / 1000) + 5)
+            update_chart()
+        return
+
+    # Redraw from a GUI timer - matplotlib must only be used from the main thread
+    timer = fig.canvas.new_timer(interval=int(CHART_REDRAW_INTERVAL_S * 1000))
+
+    def redraw_or_close() -> None:
+        """Redraw the chart, or close it if the consumer thread has stopped."""
+        if consumer_thread.is_alive():
+            update_chart()
+            return
+        # The thread only exits on its own after an error - don't show a frozen chart
+        timer.stop()
+        logger.error("Consumer thread stopped unexpectedly. Closing the chart.")
+        plt.close(fig)
+
+    timer.add_callback(redraw_or_close)
+    timer.start()
 
-    # Poll and process messages
-    logger.info(f"Polling messages from topic '{topic}'...")
     try:
-        for message in consumer:
-            message_str = message.value
-            logger.debug(f"Received message at offset {message.offset}: {message_str}")
-            process_message(message_str, rolling_window, window_size)
+        # Block in the GUI event loop until the chart window is closed
+        plt.show()
     except KeyboardInterrupt:
         logger.warning("Consumer interrupted by user.")
-    except Exception as e:
-        logger.error(f"Error while consuming messages: {e}")
     finally:
-        consumer.close()
-        logger.info(f"Kafka consumer for topic '{topic}' closed.")
+        timer.stop()
+        stop_event.set()
+        consumer_thread.join(timeout=(fetch_max_wait_ms / 1000) + 5)
 
 
 #####################################
@@ -253,6 +899,4 @@ def main() -> None:
 
 # Ensures this script runs only when executed directly (not when imported as a module).
 if __name__ == "__main__":
-    main()
-    plt.ioff()  # Turn off interactive mode after completion
-    plt.show()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -0,0 +1,238 @@
+"""
+test_project_consumer_pinkston.py
+
+Tests for the smoker message parser and batch processing.
+
+Run from the project root folder with:
+python -m pytest
+"""
+
+#####################################
+# Import Modules
+#####################################
+
+import json
+import os
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+# Render off-screen so the consumer module can be imported without a display
+os.environ["MPL_BACKEND"] = "Agg"
+
+import orjson  # noqa: E402
+
+from consumers import project_consumer_pinkston as consumer  # noqa: E402
+
+#####################################
+# Parser Tests
+#####################################
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        # json.dumps() spacing (what the producers send)
+        (
+            json.dumps({"timestamp": "2025-01-11T18:15:00", "temperature": 225.0}).encode(),
+            ("2025-01-11T18:15:00", 225.0),
+        ),
+        # compact spacing, integer temperature
+        (b'{"timestamp":"2025-01-11T18:15:00Z","temperature":70}', ("2025-01-11T18:15:00Z", 70.0)),
+        # exponent with a sign, surrounding whitespace
+        (b' {"timestamp": "2025-01-11", "temperature": -1.5e+2 }\n', ("2025-01-11", -150.0)),
+        # reversed field order
+        (b'{"temperature": 71.5, "timestamp": "2025-01-11"}', ("2025-01-11", 71.5)),
+        # space before the colon (fallback path)
+        (b'{"temperature": 71.5 , "timestamp" : "2025-01-11"}', ("2025-01-11", 71.5)),
+        # escaped characters in the timestamp (fallback path)
+        (b'{"temperature": 71.5, "timestamp": "2025-01-1\\u0031"}', ("2025-01-11", 71.5)),
+        (b'{"temperature": 71.5, "timestamp": "a\\"b"}', ('a"b', 71.5)),
+        # str input (fallback path)
+        ('{"timestamp": "2025-01-11", "temperature": 1}', ("2025-01-11", 1)),
+    ],
+)
+def test_parse_reading_valid(message, expected):
+    assert consumer.parse_reading(message) == expected
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        b'{"timestamp": "2025-01-11"}',
+        b'{"temperature": 70.0}',
+        b'{"timestamp": null, "temperature": 70.0}',
+        b'{"timestamp": "2025-01-11", "temperature": null}',
+        b'{"timestamp": "2025-01-11", "temperature": "hot"}',
+        b'{"timestamp": "2025-01-11", "temperature": true}',
+        b'{"timestamp": "2025-01-11", "temperature": [1]}',
+        b'{"timestamp": 123, "temperature": 70.0}',
+        b"[1, 2]",
+    ],
+)
+def test_parse_reading_invalid(message):
+    with pytest.raises(consumer.InvalidMessageError):
+        consumer.parse_reading(message)
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        b"garbage",
+        b"",
+        b'{"timestamp": "a", "temperature": NaN}',
+        # truncated after the last value, in either field order
+        b'{"timestamp": "2025-01-11T00:00:00", "temperature": 225.5',
+        b'{"temperature": 71.5, "timestamp": "2025-01-11"',
+        # trailing garbage after the object
+        b'{"timestamp":"x","temperature":1}garbage',
+        # numbers float() accepts but JSON does not
+        b'{"timestamp": "2025-01-11", "temperature": 1_000}',
+        b'{"timestamp": "2025-01-11", "temperature": +5}',
+        b'{"timestamp": "2025-01-11", "temperature": .5}',
+        b'{"timestamp": "2025-01-11", "temperature": 01}',
+    ],
+)
+def test_parse_reading_not_json(message):
+    with pytest.raises(orjson.JSONDecodeError):
+        consumer.parse_reading(message)
+
+
+def test_build_reading_parser_rejects_unknown_kind():
+    with pytest.raises(ValueError):
+        consumer.build_reading_parser((("timestamp", "datetime"),))
+
+
+#####################################
+# Batch Processing Tests
+#####################################
+
+
+def test_process_batch_drops_only_bad_records():
+    consumer.reset_buffers(5)
+    stats = consumer.Stats()
+    messages = [
+        b'{"timestamp": "2025-01-01T00:00:00", "temperature": 70.0}',
+        b'{"timestamp": "2025-01-01T00:00:01", "temperature": "hot"}',
+        b'{"timestamp": "not a time", "temperature": 75.0}',
+        b"garbage",
+        b'{"timestamp": "2025-01-01T00:00:02", "temperature": 71}',
+    ]
+
+    consumer.process_batch(messages, 5, stats)
+
+    times, temps = consumer.recent_readings()
+    assert [str(t) for t in times] == ["2025-01-01T00:00:00", "2025-01-01T00:00:02"]
+    assert temps.tolist() == [70.0, 71.0]
+    assert stats.total == 2
+    assert stats.window_msgs == 2
+
+
+def test_ring_buffer_keeps_most_recent_readings():
+    consumer.reset_buffers(3)
+    stats = consumer.Stats()
+    messages = [
+        json.dumps({"timestamp": f"2025-01-01T00:00:0{i}", "temperature": 80.0 + i}).encode()
+        for i in range(5)
+    ]
+
+    consumer.process_batch(messages[:2], 3, stats)
+    consumer.process_batch(messages[2:], 3, stats)
+
+    times, temps = consumer.recent_readings()
+    assert [str(t) for t in times] == [f"2025-01-01T00:00:0{i}" for i in (2, 3, 4)]
+    assert temps.tolist() == [82.0, 83.0, 84.0]
+    assert stats.total == 5
+
+
+def test_high_temp_threshold_matches_bar_colors(monkeypatch):
+    # 225.7 has no exact float32 form, so mixed precision would disagree
+    monkeypatch.setattr(consumer, "HIGH_TEMP_THRESHOLD", 225.7)
+    consumer.reset_buffers(3)
+    stats = consumer.Stats()
+
+    consumer.append_readings([np.datetime64("2025-01-01T00:00:00", "s")], [225.7], stats)
+
+    _, temps = consumer.recent_readings()
+    assert (temps >= np.float32(consumer.HIGH_TEMP_THRESHOLD)).tolist() == [True]
+    assert stats.counters[1] == 1
+    assert stats.avg_high_temp == pytest.approx(225.7, rel=1e-6)
+
+
+#####################################
+# Consumer Loop Tests
+#####################################
+
+
+class FakeConsumer:
+    """Stands in for KafkaConsumer; returns one batch, then stops or fails."""
+
+    def __init__(self, stop_event, fail):
+        self.stop_event = stop_event
+        self.fail = fail
+        self.calls = []
+
+    def poll(self, timeout_ms, max_records):
+        if self.calls:
+            if self.fail:
+                raise RuntimeError("broker went away")
+            self.stop_event.set()
+            return {}
+        self.calls.append("poll")
+        record = SimpleNamespace(
+            offset=0, value=b'{"timestamp": "2025-01-01T00:00:00", "temperature": 70.0}'
+        )
+        return {"partition-0": [record]}
+
+    def commit_async(self, callback=None):
+        self.calls.append("commit_async")
+
+    def commit(self):
+        self.calls.append("commit")
+
+    def close(self):
+        self.calls.append("close")
+
+
+def run_consumer(fake, stop_event, enable_auto_commit):
+    consumer.reset_buffers(5)
+    consumer.consume_messages(
+        fake, "smoker", stop_event, 5, 500, 100, enable_auto_commit, consumer.Stats()
+    )
+
+
+@pytest.mark.parametrize(
+    "enable_auto_commit, expected",
+    [(False, ["poll", "commit_async", "commit", "close"]), (True, ["poll", "close"])],
+)
+def test_consume_messages_commits_on_clean_stop(enable_auto_commit, expected):
+    stop_event = threading.Event()
+    fake = FakeConsumer(stop_event, fail=False)
+
+    run_consumer(fake, stop_event, enable_auto_commit)
+
+    assert fake.calls == expected
+
+
+def test_consume_messages_skips_final_commit_after_error():
+    stop_event = threading.Event()
+    fake = FakeConsumer(stop_event, fail=True)
+
+    run_consumer(fake, stop_event, enable_auto_commit=False)
+
+    assert fake.calls == ["poll", "commit_async", "close"]
+
+
+def test_consume_messages_does_not_commit_unprocessed_batch(monkeypatch):
+    def fail_append(*args):
+        raise RuntimeError("append failed")
+
+    monkeypatch.setattr(consumer, "append_readings", fail_append)
+    stop_event = threading.Event()
+    fake = FakeConsumer(stop_event, fail=False)
+
+    run_consumer(fake, stop_event, enable_auto_commit=False)
+
+    assert fake.calls == ["poll", "close"]
@@ -9,7 +9,7 @@ Consumers subscribe to a topic and read messages from the Kafka topic.
 #####################################
 
 # Import packages from Python Standard Library
-from typing import Optional, Callable
+from typing import Any, Optional, Callable
 
 # Import external packages
 from kafka import KafkaConsumer
@@ -24,6 +24,24 @@ from .utils_producer import get_kafka_broker_address
 
 DEFAULT_CONSUMER_GROUP = "test_group"
 
+# Fetch tuning defaults (match the kafka-python client defaults)
+DEFAULT_FETCH_MIN_BYTES = 1
+DEFAULT_FETCH_MAX_BYTES = 52428800
+DEFAULT_MAX_PARTITION_FETCH_BYTES = 1048576
+DEFAULT_MAX_POLL_RECORDS = 500
+DEFAULT_FETCH_MAX_WAIT_MS = 500
+
+# Offset commit defaults (auto-commit in the background, never per message)
+DEFAULT_ENABLE_AUTO_COMMIT = True
+DEFAULT_AUTO_COMMIT_INTERVAL_MS = 5000
+
+# Group membership defaults (generous, so slow batches don't trigger rebalances)
+DEFAULT_MAX_POLL_INTERVAL_MS = 300000
+DEFAULT_SESSION_TIMEOUT_MS = 45000
+
+# Must exceed both session_timeout_ms and max_poll_interval_ms (client default)
+DEFAULT_REQUEST_TIMEOUT_MS = 305000
+
 
 #####################################
 # Helper Functions
@@ -33,7 +51,17 @@ DEFAULT_CONSUMER_GROUP = "test_group"
 def create_kafka_consumer(
     topic_provided: Optional[str] = None,
     group_id_provided: Optional[str] = None,
-    value_deserializer_provided: Optional[Callable[[bytes], str]] = None,
+    value_deserializer_provided: Optional[Callable[[bytes], Any]] = None,
+    fetch_min_bytes: int = DEFAULT_FETCH_MIN_BYTES,
+    fetch_max_bytes: int = DEFAULT_FETCH_MAX_BYTES,
+    max_partition_fetch_bytes: int = DEFAULT_MAX_PARTITION_FETCH_BYTES,
+    max_poll_records: int = DEFAULT_MAX_POLL_RECORDS,
+    fetch_max_wait_ms: int = DEFAULT_FETCH_MAX_WAIT_MS,
+    enable_auto_commit: bool = DEFAULT_ENABLE_AUTO_COMMIT,
+    auto_commit_interval_ms: int = DEFAULT_AUTO_COMMIT_INTERVAL_MS,
+    max_poll_interval_ms: int = DEFAULT_MAX_POLL_INTERVAL_MS,
+    session_timeout_ms: int = DEFAULT_SESSION_TIMEOUT_MS,
+    request_timeout_ms: int = DEFAULT_REQUEST_TIMEOUT_MS,
 ):
     """
     Create and return a Kafka consumer instance.
@@ -44,6 +72,21 @@ def create_kafka_consumer(
         group_id_provided (str, optional): The consumer group ID.
             Defaults to test_group if not provided.
         value_deserializer_provided (callable, optional): Function to deserialize message values.
+            Defaults to UTF-8 decoding to str.
+        fetch_min_bytes (int, optional): Minimum bytes the broker returns per fetch.
+        fetch_max_bytes (int, optional): Maximum bytes the broker returns per fetch.
+        max_partition_fetch_bytes (int, optional): Maximum bytes per partition per fetch.
+        max_poll_records (int, optional): Maximum records returned by a single poll().
+        fetch_max_wait_ms (int, optional): Maximum time the broker waits to fill fetch_min_bytes.
+        enable_auto_commit (bool, optional): Commit offsets periodically in the background.
+            If False, the caller must commit (ideally once per polled batch).
+        auto_commit_interval_ms (int, optional): Interval between background offset commits.
+        max_poll_interval_ms (int, optional): Maximum time between poll() calls before
+            the consumer is considered failed and its partitions are rebalanced.
+        session_timeout_ms (int, optional): Time without heartbeats before the
+            consumer is removed from the group.
+        request_timeout_ms (int, optional): Client request timeout. Must be larger
+            than session_timeout_ms when a group ID is used.
 
     Returns:
         KafkaConsumer: Configured Kafka consumer instance.
@@ -61,7 +104,7 @@ def create_kafka_consumer(
 
     consumer_group_id = (group_id_provided or DEFAULT_CONSUMER_GROUP).strip()
 
-    value_deserializer: Callable[[bytes], str] = value_deserializer_provided or (
+    value_deserializer: Callable[[bytes], Any] = value_deserializer_provided or (
         lambda x: x.decode("utf-8")
     )
 
@@ -69,6 +112,19 @@ def create_kafka_consumer(
         f"Creating Kafka consumer. Topic='{topic}' and group ID='{consumer_group_id}'."
     )
     logger.debug(f"Kafka broker: {kafka_broker}")
+    logger.debug(
+        f"Fetch settings: fetch_min_bytes={fetch_min_bytes}, fetch_max_bytes={fetch_max_bytes}, "
+        f"max_partition_fetch_bytes={max_partition_fetch_bytes}, "
+        f"max_poll_records={max_poll_records}, fetch_max_wait_ms={fetch_max_wait_ms}"
+    )
+    logger.debug(
+        f"Commit settings: enable_auto_commit={enable_auto_commit}, "
+        f"auto_commit_interval_ms={auto_commit_interval_ms}"
+    )
+    logger.debug(
+        f"Group settings: max_poll_interval_ms={max_poll_interval_ms}, "
+        f"session_timeout_ms={session_timeout_ms}, request_timeout_ms={request_timeout_ms}"
+    )
 
     try:
         consumer = KafkaConsumer(
@@ -77,10 +133,17 @@ def create_kafka_consumer(
             value_deserializer=value_deserializer,
             bootstrap_servers=kafka_broker,
             auto_offset_reset="earliest",
-            enable_auto_commit=True,
-            request_timeout_ms=30000,
-            session_timeout_ms=15000,
+            enable_auto_commit=enable_auto_commit,
+            auto_commit_interval_ms=auto_commit_interval_ms,
+            request_timeout_ms=request_timeout_ms,
+            max_poll_interval_ms=max_poll_interval_ms,
+            session_timeout_ms=session_timeout_ms,
             heartbeat_interval_ms=3000,
+            fetch_min_bytes=fetch_min_bytes,
+            fetch_max_bytes=fetch_max_bytes,
+            max_partition_fetch_bytes=max_partition_fetch_bytes,
+            max_poll_records=max_poll_records,
+            fetch_max_wait_ms=fetch_max_wait_ms,
         )
         logger.info("Kafka consumer created successfully.")
         return consumer